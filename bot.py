@@ -17,6 +17,7 @@ import aiohttp
 import discord
 import mangadex
 import nhentai
+import orjson
 import redis.asyncio as aioredis
 from discord.ext import commands
 
@@ -136,7 +137,7 @@ class Ayaka(commands.AutoShardedBot):
             application_id=config.application_id,
             enable_debug_events=True,
         )
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(json_serialize=lambda o: orjson.dumps(o).decode('utf-8'))
         self.dashboard_client = HTTPClient(self)
         self.redis = aioredis.from_url(config.redis, encoding='utf-8', decode_responses=True)
         self.hentai_client = nhentai.Client()
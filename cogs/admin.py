@@ -597,7 +597,7 @@ class Admin(commands.Cog):
         else:
             text = stdout
 
-        pages = RoboPages(TextPageSource(text), ctx=ctx)
+        pages = RoboPages(await TextPageSource.create(text), ctx=ctx)
         await pages.start()
 
     @commands.command()
@@ -224,7 +224,7 @@ class Config(commands.Cog):
         if ctx.guild is None:
             return True
 
-        is_owner = await ctx.bot.is_owner(ctx.author)
+        is_owner = await ctx.author_is_owner()
         if is_owner:
             return True
 
@@ -253,7 +253,7 @@ class Config(commands.Cog):
         if ctx.guild is None:
             return True
 
-        is_owner = await ctx.bot.is_owner(ctx.author)
+        is_owner = await ctx.author_is_owner()
         if is_owner:
             return True
 
@@ -275,7 +275,7 @@ class Config(commands.Cog):
                 await con.copy_records_to_table('plonks', columns=('guild_id', 'entity_id'), records=to_insert)
 
                 # invalidate the cache for this guild
-                self.is_plonked.invalidate_containing(f'{ctx.guild.id!r}:')
+                self.is_plonked.invalidate_containing(ctx.guild.id)
 
     async def cog_command_error(self, ctx: Context, error: commands.CommandError):
         if isinstance(error, commands.BadArgument):
@@ -306,7 +306,7 @@ class Config(commands.Cog):
             await ctx.db.execute(query, ctx.guild.id, ctx.channel.id)
 
             # invalidate the cache for this guild
-            self.is_plonked.invalidate_containing(f'{ctx.guild.id!r}:')
+            self.is_plonked.invalidate_containing(ctx.guild.id)
         else:
             await self._bulk_ignore_entries(ctx, entities)
 
@@ -357,7 +357,7 @@ class Config(commands.Cog):
 
         query = "DELETE FROM plonks WHERE guild_id=$1;"
         await ctx.db.execute(query, ctx.guild.id)
-        self.is_plonked.invalidate_containing(f'{ctx.guild.id!r}:')
+        self.is_plonked.invalidate_containing(ctx.guild.id)
         await ctx.send('Successfully cleared all ignores.')
 
     @config.group(pass_context=True, invoke_without_command=True, aliases=['unplonk'])
@@ -378,7 +378,7 @@ class Config(commands.Cog):
             entity_ids = [c.id for c in entities]
             await ctx.db.execute(query, ctx.guild.id, entity_ids)
 
-        self.is_plonked.invalidate_containing(f'{ctx.guild.id!r}:')
+        self.is_plonked.invalidate_containing(ctx.guild.id)
         await ctx.send(ctx.tick(True))
 
     @unignore.command(name='all')
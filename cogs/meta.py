@@ -811,7 +811,7 @@ class Meta(commands.Cog):
 
         for feature, label in all_features.items():
             if feature in features:
-                info.append(f'{ctx.tick(True)}: {label}')
+                info.append(ctx.tick_label(True, label))
 
         if info:
             e.add_field(name='Features', value='\n'.join(info))
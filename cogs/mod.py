@@ -1778,7 +1778,7 @@ class NoMuteRole(commands.CommandError):
 
 def can_mute():
     async def predicate(ctx: ModGuildContext) -> bool:
-        is_owner = await ctx.bot.is_owner(ctx.author)
+        is_owner = await ctx.author_is_owner()
         if ctx.guild is None:
             return False
 
@@ -1797,7 +1797,7 @@ def can_mute():
 
 def can_use_block():
     async def predicate(ctx: ModGuildContext) -> bool:
-        is_owner = await ctx.bot.is_owner(ctx.author)
+        is_owner = await ctx.author_is_owner()
         if ctx.guild is None:
             return False
         if is_owner:
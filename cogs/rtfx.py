@@ -325,7 +325,7 @@ class RTFX(commands.Cog):
             return
 
         new_target = dedent(target)
-        pages = TextPageSource(new_target, prefix='```py')
+        pages = await TextPageSource.create(new_target, prefix='```py')
         menu = RoboPages(pages, ctx=ctx)
         await menu.start()
 
@@ -80,7 +80,7 @@ def requires_snipe():
 
 def can_manage_snipe():
     async def predicate(ctx: GuildContext) -> bool:
-        if await ctx.bot.is_owner(ctx.author):
+        if await ctx.author_is_owner():
             return True
         if ctx.author.guild_permissions.manage_messages:
             return True
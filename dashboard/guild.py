@@ -29,6 +29,8 @@ class GuildData(TypedDict):
 
 
 class Guild:
+    __slots__ = ('data', 'id', 'name', '_icon', 'owner', 'permissions', 'features')
+
     def __init__(self, data: GuildData) -> None:
         self.data: GuildData = data
 
@@ -55,7 +57,7 @@ class Guild:
         return (time.time() - self.fetch_time) > 20
 
     @property
-    def json(self) -> str:
+    def json(self) -> bytes:
         data = self.data.copy()
         data['fetch_time'] = self.fetch_time
-        return orjson.dumps(data).decode('utf-8')
+        return orjson.dumps(data)
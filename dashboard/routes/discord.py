@@ -85,16 +85,18 @@ class DiscordLogin(HTTPHandler, abc.ABC):
             },
             headers={"Content-Type": "application/x-www-form-urlencoded"},
         ) as response:
-            if 200 < response.status > 206:
-                raise discord.HTTPException(response, orjson.dumps(await response.json()).decode('utf-8'))
+            raw = await response.read()
+            if not 200 <= response.status < 300:
+                raise discord.HTTPException(response, raw.decode('utf-8', errors='replace'))
 
-            data = await response.json()
+            data = orjson.loads(raw)
 
         if data.get("error"):
             raise discord.HTTPException(response, orjson.dumps(data).decode('utf-8'))
 
         token_response = Token(data)
         await self.bot.redis.hset("tokens", identifier, token_response.json)
+        self._invalidate_session()
 
         if 'bot' in token_response.scope:
             if guild_id is None:
@@ -133,6 +135,7 @@ class DiscordLogin(HTTPHandler, abc.ABC):
 class DiscordLogout(HTTPHandler, abc.ABC):
     async def get(self) -> None:
         await self.bot.redis.hdel('tokens', self.get_identifier())
+        self._invalidate_session()
         self.clear_cookie('identifier')
         return self.redirect('/')
 
@@ -27,6 +27,8 @@ class TokenData(TypedDict):
 
 
 class Token:
+    __slots__ = ('data', 'access_token', 'token_type', 'expires_in', 'refresh_token', 'scope')
+
     def __init__(self, data: TokenData) -> None:
         self.data: TokenData = data
 
@@ -45,7 +47,7 @@ class Token:
         return (time.time() - self.fetch_time) > self.expires_in
 
     @property
-    def json(self) -> str:
+    def json(self) -> bytes:
         data = self.data.copy()
         data['fetch_time'] = self.fetch_time
-        return orjson.dumps(data).decode('utf-8')
+        return orjson.dumps(data)
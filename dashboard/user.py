@@ -20,6 +20,9 @@ __all__ = (
 )
 
 
+_DEFAULT_AVATAR_COUNT = len(discord.DefaultAvatar)
+
+
 class UserData(TypedDict):
     id: int
     username: str
@@ -41,6 +44,27 @@ class UserData(TypedDict):
 
 
 class User:
+    __slots__ = (
+        'data',
+        'id',
+        'username',
+        'discriminator',
+        '_avatar',
+        'bot',
+        'system',
+        'mfa_enabled',
+        '_banner',
+        'accent_colour',
+        'locale',
+        'verified',
+        'email',
+        'flags',
+        'premium_type',
+        'public_flags',
+        'avatar',
+        'banner',
+    )
+
     def __init__(self, data: UserData) -> None:
         self.data: UserData = data
 
@@ -60,15 +84,17 @@ class User:
         self.premium_type: int | None = data.get('premium_type')
         self.public_flags: int | None = data.get('public_flags')
 
-    @property
-    def avatar(self) -> str:
+        # these only depend on immutable fields, so build the URLs once
+        self.avatar: str = self._avatar_url()
+        self.banner: str | None = self._banner_url()
+
+    def _avatar_url(self) -> str:
         if not (avatar := self._avatar):
-            return f'https://cdn.discordapp.com/embed/avatars/{self.discriminator % len(discord.DefaultAvatar)}.png'
+            return f'https://cdn.discordapp.com/embed/avatars/{int(self.discriminator) % _DEFAULT_AVATAR_COUNT}.png'
         _format = 'gif' if avatar.startswith('a_') else 'png'
         return f'https://cdn.discordapp.com/avatars/{self.id}/{avatar}.{_format}?size=4096'
 
-    @property
-    def banner(self) -> str | None:
+    def _banner_url(self) -> str | None:
         if not (banner := self._banner):
             return None
         _format = 'gif' if banner.startswith('a_') else 'png'
@@ -83,10 +109,10 @@ class User:
         return (time.time() - self.fetch_time) > 20
 
     @property
-    def json(self) -> str:
+    def json(self) -> bytes:
         data = self.data.copy()
         data['fetch_time'] = self.fetch_time
-        return orjson.dumps(data).decode('utf-8')
+        return orjson.dumps(data)
 
     def __str__(self) -> str:
         return f'{self.username}#{self.discriminator}'
@@ -9,11 +9,13 @@ from __future__ import annotations
 import abc
 import binascii
 import os
+import time
 from typing import TYPE_CHECKING
 
 import discord
 import orjson
 import tornado.web
+from discord.utils import MISSING
 
 import config
 
@@ -33,18 +35,49 @@ __all__ = ('HTTPHandler',)
 class HTTPHandler(tornado.web.RequestHandler, abc.ABC):
     def initialize(self, bot: Ayaka) -> None:
         self.bot: Ayaka = bot
+        self._identifier: str | None = None
+        # raw 'tokens' and 'users' hash entries for this identifier, loaded in one round-trip
+        self._session: dict[str, str | bytes | None] | None = None
+        # resolved values, memoized for the lifetime of this request
+        self._token: Token | None = MISSING
+        self._user: User | None = MISSING
+        self._guilds: list[Guild] | None = MISSING
 
     def get_identifier(self) -> str:
+        if self._identifier is not None:
+            return self._identifier
         if _identifier := self.get_secure_cookie('identifier'):
-            return _identifier.decode('utf-8')
+            self._identifier = _identifier.decode('utf-8')
+            return self._identifier
         identifier: str = binascii.hexlify(os.urandom(32)).decode('utf-8')
         self.set_secure_cookie('identifier', identifier)
+        self._identifier = identifier
         return identifier
 
+    async def _load_session(self) -> dict[str, str | bytes | None]:
+        if self._session is None:
+            identifier = self.get_identifier()
+            pipe = self.bot.redis.pipeline(transaction=False)
+            pipe.hget('tokens', identifier)
+            pipe.hget('users', identifier)
+            token_data, user_data = await pipe.execute()
+            self._session = {'tokens': token_data, 'users': user_data}
+        return self._session
+
+    def _invalidate_session(self) -> None:
+        self._session = None
+        self._token = MISSING
+        self._user = MISSING
+        self._guilds = MISSING
+
     async def get_token(self) -> Token | None:
+        if self._token is not MISSING:
+            return self._token
         identifier = self.get_identifier()
-        token_data: str | None = await self.bot.redis.hget('tokens', identifier)
+        session = await self._load_session()
+        token_data = session['tokens']
         if not token_data:
+            self._token = None
             return None
         token = Token(orjson.loads(token_data))
         if token.expired:
@@ -57,34 +90,44 @@ class HTTPHandler(tornado.web.RequestHandler, abc.ABC):
             }
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
             async with self.bot.session.post('https://discord.com/api/oauth2/token', data=data, headers=headers) as resp:
-                if 200 < resp.status > 206:
-                    raise discord.HTTPException(resp, await resp.text())
-                data = orjson.loads(await resp.text())
+                raw = await resp.read()
+                if not 200 <= resp.status < 300:
+                    raise discord.HTTPException(resp, raw.decode('utf-8', errors='replace'))
+                data = orjson.loads(raw)
             if data.get('error'):
                 raise discord.HTTPException(resp, orjson.dumps(data).decode('utf-8'))
             token = Token(data)
-            await self.bot.redis.hset('tokens', identifier, token.json)
+            session['tokens'] = token.json
+            await self.bot.redis.hset('tokens', identifier, session['tokens'])
+        self._token = token
         return token
 
     async def fetch_user(self) -> User | None:
         if not (token := await self.get_token()):
+            self._user = None
             return None
 
         data = await self.bot.dashboard_client.request(Route('GET', '/users/@me', token=token.access_token))
         user = User(data)
         identifier = self.get_identifier()
-        await self.bot.redis.hset('users', identifier, user.json)
+        session = await self._load_session()
+        session['users'] = user.json
+        await self.bot.redis.hset('users', identifier, session['users'])
+        self._user = user
         return user
 
     async def get_user(self) -> User | None:
-        identifier = self.get_identifier()
-        data: str | None = await self.bot.redis.hget('users', identifier)
+        if self._user is not MISSING:
+            return self._user
+        session = await self._load_session()
+        data = session['users']
         if data:
             user = User(orjson.loads(data))
             if user.expired:
                 user = await self.fetch_user()
         else:
             user = await self.fetch_user()
+        self._user = user
         return user
 
     async def fetch_guilds(self) -> list[Guild] | None:
@@ -94,29 +137,41 @@ class HTTPHandler(tornado.web.RequestHandler, abc.ABC):
             return
         data = await self.bot.dashboard_client.request(Route('GET', '/users/@me/guilds', token=token.access_token))
         guilds = [Guild(guild) for guild in data]
-        await self.bot.redis.hset('guilds', str(user.id), orjson.dumps([guild.json for guild in guilds]).decode('utf-8'))
+        payload = orjson.dumps({'fetch_time': time.time(), 'guilds': [guild.data for guild in guilds]})
+        await self.bot.redis.hset('guilds', str(user.id), payload)
+        self._guilds = guilds
         return guilds
 
     async def get_guilds(self) -> list[Guild] | None:
+        if self._guilds is not MISSING:
+            return self._guilds
         if not (user := await self.get_user()):
             return
 
         data: str | None = await self.bot.redis.hget('guilds', str(user.id))
 
         if data:
-            guilds = [Guild(orjson.loads(guild)) for guild in orjson.loads(data)]
-            if any(guild.expired for guild in guilds):
+            cached = orjson.loads(data)
+            # the whole list shares one fetch time, so a single expiry check is enough
+            if not isinstance(cached, dict) or (time.time() - cached['fetch_time']) > 20:
                 guilds = await self.fetch_guilds()
+            else:
+                guilds = [Guild(guild) for guild in cached['guilds']]
         else:
             guilds = await self.fetch_guilds()
+        self._guilds = guilds
         return guilds
 
     async def get_related_guilds(self) -> dict[str, list[Guild]]:
         user_guilds = await self.get_guilds() or []
-        bot_guild_ids = [guild.id for guild in self.bot.guilds]
+        bot_guild_ids = {guild.id for guild in self.bot.guilds}
+        shared: list[Guild] = []
+        non_shared: list[Guild] = []
+        for guild in user_guilds:
+            (shared if guild.id in bot_guild_ids else non_shared).append(guild)
         return {
-            'shared_guilds': [guild for guild in user_guilds if guild.id in bot_guild_ids],
-            'non_shared_guilds': [guild for guild in user_guilds if guild.id not in bot_guild_ids],
+            'shared_guilds': shared,
+            'non_shared_guilds': non_shared,
         }
 
     async def add_to_guild(self, guild: discord.abc.Snowflake) -> bool | None:
@@ -7,8 +7,8 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from __future__ import annotations
 
 import asyncio
-import datetime
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from urllib.parse import quote
 
@@ -40,24 +40,19 @@ class Route:
         # Since these can't be handled generically, this is the next best way to do so
         self.metadata: str | None = metadata
         self.token: str = token
+        self.headers: dict[str, str] = {'Authorization': f'Bearer {token}'}
         url = self.BASE + self.path
-        if parameters:
+        if parameters and '{' in path:
+            # only strings need escaping, IDs are passed through as-is
             url = url.format_map({k: quote(v) if isinstance(v, str) else v for k, v in parameters.items()})
         self.url: str = url
         self.channel_id: str | int | None = parameters.get('channel_id')
         self.guild_id: str | int | None = parameters.get('guild_id')
         self.webhook_id: str | int | None = parameters.get('webhook_id')
         self.webhook_token: str | None = parameters.get('webhook_token')
-
-    @property
-    def key(self) -> str:
-        if self.metadata:
-            return f'{self.method} {self.path}:{self.metadata}'
-        return f'{self.method} {self.path}'
-
-    @property
-    def major_parameters(self) -> str:
-        return '+'.join(
+        # both of these are read several times per request, so compute them once
+        self.key: str = f'{method} {path}:{metadata}' if metadata else f'{method} {path}'
+        self.major_parameters: str = '+'.join(
             str(k) for k in (self.channel_id, self.guild_id, self.webhook_id, self.webhook_token) if k is not None
         )
 
@@ -89,7 +84,7 @@ class Ratelimit:
         # The object that is sleeping is ultimately responsible for freeing the semaphore
         # for the requests currently pending.
         self._sleeping: asyncio.Lock = asyncio.Lock()
-        self._last_request: float = self._loop.time()
+        self._last_request: float = time.monotonic()
 
     def __repr__(self) -> str:
         return (
@@ -114,14 +109,11 @@ class Ratelimit:
 
         reset_after = headers.get('X-Ratelimit-Reset-After')
         if use_clock or not reset_after:
-            utc = datetime.timezone.utc
-            now = datetime.datetime.now(utc)
-            reset = datetime.datetime.fromtimestamp(float(headers['X-Ratelimit-Reset']), utc)
-            self.reset_after = (reset - now).total_seconds()
+            self.reset_after = float(headers['X-Ratelimit-Reset']) - time.time()
         else:
             self.reset_after = float(reset_after)
 
-        self.expires = self._loop.time() + self.reset_after
+        self.expires = time.monotonic() + self.reset_after
 
     def _wake_next(self) -> None:
         while self._pending_requests:
@@ -148,14 +140,14 @@ class Ratelimit:
         self._wake(self.remaining)
 
     def is_expired(self) -> bool:
-        return self.expires is not None and self._loop.time() > self.expires
+        return self.expires is not None and time.monotonic() > self.expires
 
     def is_inactive(self) -> bool:
-        delta = self._loop.time() - self._last_request
+        delta = time.monotonic() - self._last_request
         return delta >= 300 and self.outgoing == 0 and len(self._pending_requests) == 0
 
     async def acquire(self) -> None:
-        self._last_request = self._loop.time()
+        self._last_request = time.monotonic()
         if self.is_expired():
             self.reset()
 
@@ -190,14 +182,11 @@ class Ratelimit:
 
 
 async def json_or_text(response: aiohttp.ClientResponse) -> dict[str, Any] | str:
-    text = await response.text(encoding='utf-8')
-    try:
-        if response.headers['content-type'] == 'application/json':
-            return orjson.loads(text)
-    except KeyError:
-        # thanks Cloudflare
-        pass
-    return text
+    raw = await response.read()
+    # content-type can be missing, thanks Cloudflare
+    if response.headers.get('content-type', '').startswith('application/json'):
+        return orjson.loads(raw)
+    return raw.decode('utf-8', errors='replace')
 
 
 class HTTPClient:
@@ -211,17 +200,22 @@ class HTTPClient:
         # When the key is the latter, it is used for temporary
         # one shot requests that don't have a bucket hash
         # When this reaches 256 elements, it will try to evict based off of expiry
-        self._buckets: dict[str, Ratelimit] = {}
+        # Buckets are kept in least recently used order, so inactive ones collect at the front
+        self._buckets: OrderedDict[str, Ratelimit] = OrderedDict()
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
 
     def _try_clear_expired_ratelimits(self) -> None:
-        if len(self._buckets) < 256:
-            return
-
-        keys = [key for key, bucket in self._buckets.items() if bucket.is_inactive()]
-        for key in keys:
-            del self._buckets[key]
+        # at most one pass over the buckets. active ones are moved out of the way
+        # so they can't shield the inactive ones queued up behind them
+        for _ in range(len(self._buckets)):
+            if len(self._buckets) < 256:
+                break
+            key, bucket = next(iter(self._buckets.items()))
+            if bucket.is_inactive():
+                del self._buckets[key]
+            else:
+                self._buckets.move_to_end(key)
 
     def get_ratelimit(self, key: str) -> Ratelimit:
         try:
@@ -229,6 +223,8 @@ class HTTPClient:
         except KeyError:
             self._buckets[key] = value = Ratelimit()
             self._try_clear_expired_ratelimits()
+        else:
+            self._buckets.move_to_end(key)
         return value
 
     async def request(self, route: Route, with_bot: bool = False, **kwargs: Any) -> Any:
@@ -242,10 +238,14 @@ class HTTPClient:
             key = f'{bucket_hash}:{route.major_parameters}'
 
         ratelimit = self.get_ratelimit(key)
-        if not with_bot:
-            kwargs['headers'] = {'Authorization': f'Bearer {route.token}'}
-        else:
-            kwargs['headers'] = {'Authorization': f'Bot {self.bot.http.token}'}
+        headers = route.headers if not with_bot else {'Authorization': f'Bot {self.bot.http.token}'}
+        if 'json' in kwargs:
+            headers = {**headers, 'Content-Type': 'application/json'}
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+        # caller supplied headers are merged in rather than clobbered
+        if extra := kwargs.get('headers'):
+            headers = {**headers, **extra}
+        kwargs['headers'] = headers
 
         if not self._global_over.is_set():
             await self._global_over.wait()
@@ -11,31 +11,31 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import functools
 import json
 import logging
+import logging.config
 import os
 import re
 import sys
 import traceback
 import uuid
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Generator, TypedDict
+from typing import Any, Generator, TypedDict
 
 import asyncpg
 import click
 import discord
 
 import config
-from bot import Ayaka
 
 
 try:
     import uvloop
 except ImportError:
-    pass
+    _run = asyncio.run
 else:
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _run = uvloop.run
 
 
 class Revisions(TypedDict):
@@ -115,7 +115,7 @@ class Migrations:
     def is_next_revision_taken(self) -> bool:
         return self.version + 1 in self.revisions
 
-    @property
+    @functools.cached_property
     def ordered_revisions(self) -> list[Revision]:
         return sorted(self.revisions.values(), key=lambda r: r.version)
 
@@ -168,24 +168,48 @@ class RemoveNoise(logging.Filter):
         return True
 
 
+LOGGING_CONFIG: dict[str, Any] = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'remove_noise': {'()': RemoveNoise},
+    },
+    'formatters': {
+        'file': {
+            'format': '[{asctime}] [{levelname:<7}] {name}: {message}',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': 'ayaka.log',
+            'encoding': 'utf-8',
+            'mode': 'w',
+            'maxBytes': 32 * 1024 * 1024,
+            'backupCount': 5,
+            'formatter': 'file',
+        },
+    },
+    'loggers': {
+        'discord': {'level': 'INFO'},
+        'discord.http': {'level': 'WARNING'},
+        'discord.state': {'filters': ['remove_noise']},
+        'mangadex.http': {'level': 'DEBUG'},
+    },
+    'root': {'level': 'INFO', 'handlers': ['file']},
+}
+
+
 @contextlib.contextmanager
 def setup_logging() -> Generator[None, None, None]:
     log = logging.getLogger()
     try:
-        discord.utils.setup_logging()
         # __enter__
-        logging.getLogger('discord').setLevel(logging.INFO)
-        logging.getLogger('discord.http').setLevel(logging.WARNING)
-        logging.getLogger('discord.state').addFilter(RemoveNoise())
-        logging.getLogger('mangadex.http').setLevel(logging.DEBUG)
-        handler = RotatingFileHandler(
-            filename='ayaka.log', encoding='utf-8', mode='w', maxBytes=32 * 1024 * 1024, backupCount=5
-        )
-        log.setLevel(logging.INFO)
-        dt_fmt = '%Y-%m-%d %H:%M:%S'
-        fmt = logging.Formatter('[{asctime}] [{levelname:<7}] {name}: {message}', dt_fmt, style='{')
-        handler.setFormatter(fmt)
-        log.addHandler(handler)
+        # dictConfig replaces the root handlers, so the console handler has to be added afterwards
+        logging.config.dictConfig(LOGGING_CONFIG)
+        discord.utils.setup_logging()
         yield
     finally:
         # __exit__
@@ -221,6 +245,9 @@ async def create_pool() -> asyncpg.Pool:
 
 
 async def run_bot() -> None:
+    # importing the bot pulls in discord.py's extensions and the web stack, which the db commands don't need
+    from bot import Ayaka
+
     log = logging.getLogger()
     async with Ayaka() as bot:
         try:
@@ -240,7 +267,7 @@ def main(ctx: click.Context) -> None:
     """Launches the bot."""
     if ctx.invoked_subcommand is None:
         with setup_logging():
-            asyncio.run(run_bot())
+            _run(run_bot())
 
 
 @main.group(short_help='database stuff', options_metavar='[options]')
@@ -258,13 +285,13 @@ async def ensure_uri_can_run() -> bool:
 def init() -> None:
     """Initializes the database and runs all the current migrations."""
 
-    asyncio.run(ensure_uri_can_run())
+    _run(ensure_uri_can_run())
 
     migrations = Migrations()
     migrations.database_uri = config.postgresql
 
     try:
-        applied = asyncio.run(run_upgrade(migrations))
+        applied = _run(run_upgrade(migrations))
     except Exception:
         traceback.print_exc()
         click.secho('failed to initialize and apply migrations due to error', fg='red')
@@ -302,7 +329,7 @@ def upgrade(sql: bool) -> None:
         return
 
     try:
-        applied = asyncio.run(run_upgrade(migrations))
+        applied = _run(run_upgrade(migrations))
     except Exception:
         traceback.print_exc()
         click.secho('failed to apply migrations due to error', fg='red')
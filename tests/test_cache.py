@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+pytest.importorskip('discord')
+pytest.importorskip('lru')
+
+from utils import cache  # noqa: E402
+
+
+def test_cache_unhashable_argument() -> None:
+    calls = 0
+
+    @cache.cache(strategy=cache.Strategy.raw)
+    async def total(values: list[int]) -> int:
+        nonlocal calls
+        calls += 1
+        return sum(values)
+
+    async def runner() -> None:
+        assert await total([1, 2, 3]) == 6
+        assert await total([1, 2, 3]) == 6
+        assert await total([4, 5]) == 9
+        assert total.invalidate([1, 2, 3])
+
+    asyncio.run(runner())
+    assert calls == 2
+
+
+def test_cache_invalidate_containing_guild_id() -> None:
+    class Cog:
+        @cache.cache(strategy=cache.Strategy.raw, ignore_kwargs=True)
+        async def is_plonked(self, guild_id: int, member_id: int, *, connection: object = None) -> bool:
+            return False
+
+    cog = Cog()
+
+    async def runner() -> None:
+        await cog.is_plonked(1234, 1)
+        await cog.is_plonked(1234, 2)
+        await cog.is_plonked(5678, 1)
+
+    asyncio.run(runner())
+    assert len(Cog.is_plonked.cache) == 3
+
+    # the guild id is stored as an int, so its string form must not match
+    Cog.is_plonked.invalidate_containing('1234')
+    assert len(Cog.is_plonked.cache) == 3
+
+    Cog.is_plonked.invalidate_containing(1234)
+    assert [k for k in Cog.is_plonked.cache if 1234 in k] == []
+    assert Cog.is_plonked.get_key(cog, 5678, 1) in Cog.is_plonked.cache
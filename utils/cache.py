@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import heapq
+import itertools
 import time
-from collections.abc import Callable, Coroutine, Iterator, MutableMapping
-from functools import wraps
+from collections.abc import Callable, Coroutine, Hashable, Iterator, MutableMapping
+from functools import singledispatch, wraps
 from typing import Any, Protocol, TypeVar
 
+from discord.ext import commands
 from lru import LRU
 
 
@@ -21,56 +24,98 @@ R = TypeVar('R')
 
 # Can't use ParamSpec due to https://github.com/python/typing/discussions/946
 class CacheProtocol(Protocol[R]):
-    cache: MutableMapping[str, asyncio.Task[R]]
+    cache: MutableMapping[tuple[Hashable, ...], asyncio.Task[R]]
 
     def __call__(self, *args: Any, **kwds: Any) -> asyncio.Task[R]: ...
 
-    def get_key(self, *args: Any, **kwargs: Any) -> str: ...
+    def get_key(self, *args: Any, **kwargs: Any) -> tuple[Hashable, ...]: ...
 
     def invalidate(self, *args: Any, **kwargs: Any) -> bool: ...
 
-    def invalidate_containing(self, key: str) -> None: ...
+    def invalidate_containing(self, key: Hashable) -> None: ...
 
     def get_stats(self) -> tuple[int, int]: ...
 
 
-class ExpiringCache(dict[str, tuple[R, float]]):
+class ExpiringCache(dict[Hashable, tuple[R, float]]):
+    __slots__ = ('__ttl', '__expiry', '__counter')
+
     def __init__(self, seconds: float) -> None:
         self.__ttl = seconds
+        # min-heap of (deadline, insertion order, key), the counter breaks ties
+        # so that keys never have to be compared with each other
+        self.__expiry: list[tuple[float, int, Hashable]] = []
+        self.__counter = itertools.count()
         super().__init__()
 
     def __verify_cache_integrity(self) -> None:
-        # have to do this in two steps...
         current_time = time.monotonic()
-        to_remove = [k for k, (_, t) in super().items() if current_time > (t + self.__ttl)]
-        for k in to_remove:
-            del self[k]
-
-    def __contains__(self, key: str) -> bool:
+        expiry = self.__expiry
+        while expiry and expiry[0][0] < current_time:
+            deadline, _, key = heapq.heappop(expiry)
+            # entries that were overwritten or removed since leave stale heap items behind
+            entry = super().get(key)
+            if entry is not None and entry[1] == deadline:
+                super().__delitem__(key)
+
+    def __contains__(self, key: Hashable) -> bool:
         self.__verify_cache_integrity()
         return super().__contains__(key)
 
-    def __getitem__(self, key: str) -> R:
+    def __getitem__(self, key: Hashable) -> R:
         self.__verify_cache_integrity()
         tup = super().__getitem__(key)
         return tup[0]
 
-    def get(self, key: str, default: Any = None):
+    def get(self, key: Hashable, default: Any = None):
         v = super().get(key, default)
         if v is default:
             return default
         return v[0]
 
-    def __setitem__(self, key: str, value: R) -> None:
-        super().__setitem__(key, (value, time.monotonic()))
+    def __setitem__(self, key: Hashable, value: R) -> None:
+        deadline = time.monotonic() + self.__ttl
+        super().__setitem__(key, (value, deadline))
+        heapq.heappush(self.__expiry, (deadline, next(self.__counter), key))
 
     def values(self) -> Iterator[R]:
         return map(lambda x: x[0], super().values())
 
-    def items(self) -> Iterator[tuple[str, R]]:
+    def items(self) -> Iterator[tuple[Hashable, R]]:
         return map(lambda x: (x[0], x[1][0]), super().items())
 
 
+# see the note in _make_key
+_IGNORED_KWARGS = frozenset({'connection', 'pool'})
+
+
+# we do not care what 'self' parameter or the invocation context is,
+# so those and anything with the default __repr__ are keyed by their
+# class rather than the instance. unhashable arguments (lists, dicts)
+# are keyed by their repr, as every argument used to be.
+@singledispatch
+def _key_part(o: Any) -> Hashable:
+    if o.__class__.__repr__ is object.__repr__:
+        return o.__class__
+    try:
+        hash(o)
+    except TypeError:
+        return repr(o)
+    return o
+
+
+@_key_part.register(commands.Context)
+def _(o: commands.Context[Any]) -> Hashable:
+    return o.__class__
+
+
+@_key_part.register(int)
+@_key_part.register(str)
+@_key_part.register(type(None))
+def _(o: int | str | None) -> Hashable:
+    return o
+
+
 class Strategy(enum.Enum):
     lru = 1
     raw = 2
@@ -91,27 +136,23 @@ def cache(
             _internal_cache = ExpiringCache(maxsize)
             _stats = lambda: (0, 0)
 
-        def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-            # this is a bit of a clusterfuck
-            # we do not care what 'self' parameter is when we __repr__ it
-            def _true_repr(o):
-                if o.__class__.__repr__ is object.__repr__:
-                    return f'<{o.__class__.__module__}.{o.__class__.__name__}>'
-                return repr(o)
+        # computed once per decorated function rather than on every lookup
+        prefix = f'{func.__module__}.{func.__name__}'
 
-            key = [f'{func.__module__}.{func.__name__}']
-            key.extend(_true_repr(a) for a in args)
+        def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Hashable, ...]:
+            key: list[Hashable] = [prefix]
+            key.extend(_key_part(a) for a in args)
             if not ignore_kwargs:
                 for k, v in kwargs.items():
                     # note: this only really works for this use case in particular
                     # I want to pass asyncpg.Connection objects to the parameters
                     # however, they use default __repr__ and I do not care what
                     # connection is passed in so I needed a bypass.
-                    if k == 'connection' or k == 'pool':
+                    if k in _IGNORED_KWARGS:
                         continue
-                    key.append(_true_repr(k))
-                    key.append(_true_repr(v))
-            return ':'.join(key)
+                    key.append(k)
+                    key.append(_key_part(v))
+            return tuple(key)
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> asyncio.Task[R]:
@@ -132,16 +173,10 @@ def cache(
             else:
                 return True
 
-        def _invalidate_containing(key: str) -> None:
-            to_remove = []
-            for k in _internal_cache.keys():
-                if key in k:
-                    to_remove.append(k)
-            for k in to_remove:
-                try:
-                    del _internal_cache[key]
-                except KeyError:
-                    continue
+        def _invalidate_containing(key: Hashable) -> None:
+            # materialise the matches first, the cache can't change size while iterating
+            for k in [k for k in _internal_cache.keys() if isinstance(k, tuple) and key in k]:
+                _internal_cache.pop(k, None)
 
         wrapper.cache = _internal_cache  # type: ignore # can't be done
         wrapper.get_key = lambda *args, **kwargs: _make_key(args, kwargs)  # type: ignore # can't be done
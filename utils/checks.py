@@ -7,6 +7,7 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 from collections.abc import Iterable
 from typing import Any, Callable, TypeVar
 
+import discord
 from discord import app_commands
 from discord.ext import commands
 
@@ -16,19 +17,50 @@ from utils.context import Context, GuildContext
 T = TypeVar('T')
 
 
+PermissionMatcher = Callable[[discord.Permissions], bool]
+
+
+def _compile_permissions(perms: dict[str, bool], check: Callable[[Iterable[Any]], bool] = all) -> PermissionMatcher:
+    # bits that have to be set and bits that have to be unset respectively
+    required = discord.Permissions(**{name: True for name, value in perms.items() if value}).value
+    forbidden = discord.Permissions(**{name: True for name, value in perms.items() if not value}).value
+
+    if check is all:
+        return lambda resolved: resolved.value & required == required and not resolved.value & forbidden
+    if check is any:
+        return lambda resolved: bool(resolved.value & required or ~resolved.value & forbidden)
+    return lambda resolved: check(getattr(resolved, name, None) == value for name, value in perms.items())
+
+
+async def _check_permissions(ctx: GuildContext, matcher: PermissionMatcher) -> bool:
+    is_owner = await ctx.author_is_owner()
+    if is_owner:
+        return True
+    return matcher(ctx.channel.permissions_for(ctx.author))
+
+
+async def _check_guild_permissions(ctx: GuildContext, matcher: PermissionMatcher) -> bool:
+    is_owner = await ctx.author_is_owner()
+    if is_owner:
+        return True
+
+    if ctx.guild is None:
+        return False
+
+    return matcher(ctx.author.guild_permissions)
+
+
 async def check_permissions(
     ctx: GuildContext, perms: dict[str, bool], *, check: Callable[[Iterable[Any]], bool] = all
 ) -> bool:
-    is_owner = await ctx.bot.is_owner(ctx.author)
-    if is_owner:
-        return True
-    resolved = ctx.channel.permissions_for(ctx.author)
-    return check(getattr(resolved, name, None) == value for name, value in perms.items())
+    return await _check_permissions(ctx, _compile_permissions(perms, check))
 
 
 def has_permissions(*, check: Callable[[Iterable[Any]], bool] = all, **perms: bool) -> Callable[[T], T]:
+    matcher = _compile_permissions(perms, check)
+
     async def pred(ctx) -> bool:
-        return await check_permissions(ctx, perms, check=check)
+        return await _check_permissions(ctx, matcher)
 
     return commands.check(pred)
 
@@ -36,20 +68,14 @@ def has_permissions(*, check: Callable[[Iterable[Any]], bool] = all, **perms: bo
 async def check_guild_permissions(
     ctx: GuildContext, perms: dict[str, bool], *, check: Callable[[Iterable[Any]], bool] = all
 ) -> bool:
-    is_owner = await ctx.bot.is_owner(ctx.author)
-    if is_owner:
-        return True
-
-    if ctx.guild is None:
-        return False
-
-    resolved = ctx.author.guild_permissions
-    return check(getattr(resolved, name, None) == value for name, value in perms.items())
+    return await _check_guild_permissions(ctx, _compile_permissions(perms, check))
 
 
 def has_guild_permissions(*, check: Callable[[Iterable[Any]], bool] = all, **perms: bool) -> Callable[[T], T]:
+    matcher = _compile_permissions(perms, check)
+
     async def pred(ctx) -> bool:
-        return await check_guild_permissions(ctx, perms, check=check)
+        return await _check_guild_permissions(ctx, matcher)
 
     return commands.check(pred)
 
@@ -58,8 +84,10 @@ def has_guild_permissions(*, check: Callable[[Iterable[Any]], bool] = all, **per
 
 
 def hybrid_permissions_check(**perms: bool) -> Callable[[T], T]:
+    matcher = _compile_permissions(perms)
+
     async def pred(ctx: GuildContext):
-        return await check_guild_permissions(ctx, perms)
+        return await _check_guild_permissions(ctx, matcher)
 
     def decorator(func: T) -> T:
         commands.check(pred)(func)
@@ -84,18 +112,20 @@ def is_admin() -> Callable[[T], T]:
 def mod_or_permissions(**perms: bool) -> Callable[[T], T]:
     perms['ban_members'] = True
     perms['manage_messages'] = True
+    matcher = _compile_permissions(perms, any)
 
     async def pred(ctx: GuildContext) -> bool:
-        return await check_guild_permissions(ctx, perms, check=any)
+        return await _check_guild_permissions(ctx, matcher)
 
     return commands.check(pred)
 
 
 def admin_or_permissions(**perms: bool) -> Callable[[T], T]:
     perms['administrator'] = True
+    matcher = _compile_permissions(perms, any)
 
     async def pred(ctx: GuildContext) -> bool:
-        return await check_guild_permissions(ctx, perms, check=any)
+        return await _check_guild_permissions(ctx, matcher)
 
     return commands.check(pred)
 
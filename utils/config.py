@@ -5,17 +5,22 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
 import asyncio
+import itertools
 import json
 import os
 import pathlib
-import uuid
 from typing import Any, Callable, Generic, TypeVar, overload
 
+import orjson
+
 
 _T = TypeVar('_T')
 
 ObjectHook = Callable[[dict[str, Any]], Any]
 
+# unique temp file suffixes within this process, os.replace makes the swap atomic
+_tmp_counter = itertools.count()
+
 
 class Config(Generic[_T]):
     def __init__(
@@ -32,6 +37,7 @@ class Config(Generic[_T]):
         self.loop = asyncio.get_running_loop()
         self.lock = asyncio.Lock()
         self._db: dict[str, _T | Any] = {}
+        self._save_task: asyncio.Task[None] | None = None
         if load_later:
             self.loop.create_task(self.load())
         else:
@@ -39,26 +45,51 @@ class Config(Generic[_T]):
 
     def load_from_file(self):
         try:
-            with open(self.name, 'r', encoding='utf-8') as f:
-                self._db = json.load(f, object_hook=self.object_hook)
+            with open(self.name, 'rb') as f:
+                data = f.read()
         except FileNotFoundError:
             self._db = {}
+            return
+
+        # orjson has no hook support, the stdlib is only needed for custom decoding
+        if self.object_hook is None:
+            self._db = orjson.loads(data)
+        else:
+            self._db = json.loads(data, object_hook=self.object_hook)
 
     async def load(self):
         async with self.lock:
             await self.loop.run_in_executor(None, self.load_from_file)
 
-    def _dump(self):
-        temp = self.name.with_stem(f'{uuid.uuid4()}-{self.name.stem}').with_suffix('.tmp')
-        with open(temp, 'w', encoding='utf-8') as tmp:
-            json.dump(self._db.copy(), tmp, ensure_ascii=True, cls=self.encoder, separators=(',', ':'))
+    def _dump(self, data: dict[str, _T | Any]):
+        temp = self.name.with_stem(f'{os.getpid()}-{next(_tmp_counter)}-{self.name.stem}').with_suffix('.tmp')
+        if self.encoder is None:
+            with open(temp, 'wb') as tmp:
+                tmp.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(temp, 'w', encoding='utf-8') as tmp:
+                json.dump(data, tmp, ensure_ascii=True, cls=self.encoder, separators=(',', ':'))
 
         # atomically move the file
         os.replace(temp, self.name)
 
     async def save(self) -> None:
         async with self.lock:
-            await self.loop.run_in_executor(None, self._dump)
+            # put/remove mutate _db on the event loop without the lock, so the executor
+            # needs its own snapshot, taken here where nothing else can run
+            await self.loop.run_in_executor(None, self._dump, self._db.copy())
+
+    async def _delayed_save(self) -> None:
+        await asyncio.sleep(0.05)
+        # writes from here on need a new save, this one may already have its snapshot
+        self._save_task = None
+        await self.save()
+
+    def _schedule_save(self) -> asyncio.Task[None]:
+        # a burst of writes shares a single pending save
+        if self._save_task is None:
+            self._save_task = self.loop.create_task(self._delayed_save())
+        return self._save_task
 
     @overload
     def get(self, key: Any) -> _T | Any | None: ...
@@ -71,11 +102,11 @@ class Config(Generic[_T]):
 
     async def put(self, key: Any, value: _T | Any) -> None:
         self._db[str(key)] = value
-        await self.save()
+        await asyncio.shield(self._schedule_save())
 
     async def remove(self, key: Any) -> None:
         del self._db[str(key)]
-        await self.save()
+        await asyncio.shield(self._schedule_save())
 
     def __contains__(self, item: Any) -> bool:
         return str(item) in self._db
@@ -65,27 +65,31 @@ class Context(commands.Context['Ayaka']):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.pool = self.bot.pool
+        self._author_is_owner: bool | None = None
 
     async def entry_to_code(self, entries: Iterable[tuple[str, str]]) -> None:
         width = max(len(a) for a, _ in entries)
-        output = ['```']
-        for name, entry in entries:
-            output.append(f'{name:<{width}}: {entry}')
-        output.append('```')
+        fmt = f'{{:<{width}}}: {{}}'.format
+        output = ['```', *(fmt(name, entry) for name, entry in entries), '```']
         await self.send('\n'.join(output))
 
     async def indented_entry_to_code(self, entries: Iterable[tuple[str, str]]) -> None:
         width = max(len(a) for a, _ in entries)
-        output = ['```']
-        for name, entry in entries:
-            output.append(f'\u200b{name:<{width}}: {entry}')
-        output.append('```')
+        fmt = f'\u200b{{:<{width}}}: {{}}'.format
+        output = ['```', *(fmt(name, entry) for name, entry in entries), '```']
         await self.send('\n'.join(output))
 
     def __repr__(self) -> str:
-        # we need this for out cache key strategy
+        # the cache decorator keys contexts by type rather than instance, so
+        # there is nothing per-instance worth showing here either
         return '<Context>'
 
+    async def author_is_owner(self) -> bool:
+        # several checks ask this during a single invocation, only resolve it once
+        if self._author_is_owner is None:
+            self._author_is_owner = await self.bot.is_owner(self.author)
+        return self._author_is_owner
+
     @property
     def session(self) -> ClientSession:
         return self.bot.session
@@ -135,12 +139,11 @@ class Context(commands.Context['Ayaka']):
         await view.wait()
         return view.value
 
-    def tick(self, opt: bool | None, label: str | None = None) -> str:
-        lookup = self.bot.emoji
-        emoji = lookup.get(opt, '❌')
-        if label is not None:
-            return f'{emoji}: {label}'
-        return emoji
+    def tick(self, opt: bool | None) -> str:
+        return self.bot.emoji.get(opt, '❌')
+
+    def tick_label(self, opt: bool | None, label: str) -> str:
+        return f'{self.tick(opt)}: {label}'
 
     @property
     def db(self) -> DatabaseProtocol:
@@ -152,11 +155,12 @@ class Context(commands.Context['Ayaka']):
         await self.invoke(cmd, command=command)  # type: ignore
 
     async def safe_send(self, content: str, *, escape_mentions: bool = True, **kwargs) -> discord.Message:
-        if escape_mentions:
+        # mentions in an attachment don't ping anyone, so only escape what is sent inline
+        if escape_mentions and len(content) <= 2000:
             content = discord.utils.escape_mentions(content)
 
         if len(content) > 2000:
-            fp = io.BytesIO(content.encode())
+            fp = io.BytesIO(content.encode('utf-8'))
             kwargs.pop('file', None)
             return await self.send(file=discord.File(fp, filename='message_too_long.txt'), **kwargs)
         else:
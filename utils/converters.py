@@ -10,6 +10,7 @@ import zoneinfo
 from typing import Any, Literal, Sequence, Type, TypedDict
 
 import discord
+import orjson
 import yarl
 from discord.ext import commands
 from typing_extensions import NotRequired, Self
@@ -17,6 +18,11 @@ from typing_extensions import NotRequired, Self
 from utils.context import Context, GuildContext
 
 
+# these converters hold no per-invocation state, so a single instance can be shared
+_MESSAGE_CONVERTER = commands.MessageConverter()
+_CLEAN_CONTENT = commands.clean_content()
+
+
 class DucklingNormalised(TypedDict):
     unit: Literal['second']
     value: int
@@ -45,11 +51,60 @@ class DucklingResponse(TypedDict):
 
 
 class MemeDict(dict):
-    def __getitem__(self, k: Sequence[Any]) -> Any:
-        for key in self:
-            if k in key:
-                return super().__getitem__(key)
-        raise KeyError(k)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        # flatten the alias tuples so lookups are a single hash probe rather than a scan over every key
+        self._index: dict[Any, Any] = {}
+        for key, value in self.items():
+            for alias in key:
+                self._index.setdefault(alias, value)
+
+    def __setitem__(self, k: Sequence[Any], v: Any) -> None:
+        super().__setitem__(k, v)
+        self._reindex()
+
+    def __delitem__(self, k: Sequence[Any]) -> None:
+        super().__delitem__(k)
+        self._reindex()
+
+    # the remaining mutators are inherited from dict and bypass the two above
+
+    def __ior__(self, other: Any) -> Self:
+        super().__ior__(other)
+        self._reindex()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._reindex()
+
+    def setdefault(self, k: Sequence[Any], default: Any = None) -> Any:
+        value = super().setdefault(k, default)
+        self._reindex()
+        return value
+
+    def pop(self, k: Sequence[Any], *args: Any) -> Any:
+        value = super().pop(k, *args)
+        self._reindex()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._reindex()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    def __getitem__(self, k: Any) -> Any:
+        try:
+            return self._index[k]
+        except (KeyError, TypeError):
+            raise KeyError(k) from None
 
 
 class RedditMediaURL:
@@ -82,7 +137,7 @@ class RedditMediaURL:
             if resp.status != 200:
                 raise commands.BadArgument(f'Reddit API failed with {resp.status}.')
 
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             try:
                 submission = data[0]['data']['children'][0]['data']
             except (KeyError, TypeError, IndexError):
@@ -109,17 +164,18 @@ class RedditMediaURL:
 class DatetimeConverter(commands.Converter[datetime.datetime]):
     @staticmethod
     async def get_timezone(ctx: Context) -> zoneinfo.ZoneInfo | None:
-        if ctx.guild is None:
-            tz = zoneinfo.ZoneInfo('UTC')
-        else:
-            row: str | None = await ctx.db.fetchval(
-                'SELECT tz FROM tz_store WHERE user_id = $1 and $2 = ANY(guild_ids);', ctx.author.id, ctx.guild.id
-            )
-            if row:
-                tz = zoneinfo.ZoneInfo(row)
-            else:
-                tz = zoneinfo.ZoneInfo('UTC')
-        return tz
+        # Reminder.get_timezone is cached and invalidated when the user changes their timezone,
+        # and ZoneInfo keeps its own cache of constructed zones, so neither hits the disk or DB per call
+        reminder = ctx.bot.reminder
+        if reminder is None:
+            return zoneinfo.ZoneInfo('UTC')
+        name = await reminder.get_timezone(ctx.author.id)
+        if name is None:
+            return zoneinfo.ZoneInfo('UTC')
+        try:
+            return zoneinfo.ZoneInfo(name)
+        except (ValueError, zoneinfo.ZoneInfoNotFoundError):
+            return zoneinfo.ZoneInfo('UTC')
 
     @classmethod
     async def parse(
@@ -139,7 +195,7 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
             'http://127.0.0.1:7731/parse',
             data={'locale': 'en_GB', 'text': argument, 'dims': '["time", "duration"]', 'tz': str(timezone)},
         ) as resp:
-            data: list[DucklingResponse] = await resp.json()
+            data: list[DucklingResponse] = orjson.loads(await resp.read())
 
             for time in data:
                 if time['dim'] == 'time' and 'value' in time['value']:
@@ -147,8 +203,7 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
                 elif time['dim'] == 'duration':
                     times.append(
                         (
-                            datetime.datetime.now(datetime.timezone.utc)
-                            + datetime.timedelta(seconds=time['value']['normalized']['value']),
+                            now + datetime.timedelta(seconds=time['value']['normalized']['value']),
                             time['start'],
                             time['end'],
                         )
@@ -171,22 +226,15 @@ class DatetimeConverter(commands.Converter[datetime.datetime]):
 
 
 class WhenAndWhatConverter_(commands.Converter[tuple[datetime.datetime, str]]):
+    STRIP_RE = re.compile(r'(?:me (?:to|in|at|that) )?(.*?)(?:from now)?', re.DOTALL)
+
     @classmethod
     async def convert(cls, ctx: GuildContext, argument: str) -> tuple[datetime.datetime, str]:
         timezone = await DatetimeConverter.get_timezone(ctx)
         now = ctx.message.created_at.astimezone(tz=timezone)
 
         # Strip some commmon stuff
-        for prefix in ('me to ', 'me in ', 'me at ', 'me that '):
-            if argument.startswith(prefix):
-                argument = argument[len(prefix) :]
-                break
-
-        for suffix in ('from now',):
-            if argument.endswith(suffix):
-                argument = argument[: -len(suffix)]
-
-        argument = argument.strip()
+        argument = cls.STRIP_RE.fullmatch(argument).group(1).strip()  # type: ignore # always matches
 
         # Determine the date argument
         parsed_times = await DatetimeConverter.parse(argument, ctx=ctx, timezone=timezone, now=now)
@@ -220,7 +268,7 @@ class WhenAndWhatConverter_(commands.Converter[tuple[datetime.datetime, str]]):
 class MessageOrContent(commands.Converter[discord.Message | str]):
     async def convert(self, ctx: Context, argument: str) -> discord.Message | str:
         try:
-            msg = await commands.MessageConverter().convert(ctx, argument)
+            msg = await _MESSAGE_CONVERTER.convert(ctx, argument)
         except commands.BadArgument:
             return argument
         return msg
@@ -229,9 +277,9 @@ class MessageOrContent(commands.Converter[discord.Message | str]):
 class MessageOrCleanContent(commands.Converter[discord.Message | commands.clean_content]):
     async def convert(self, ctx: Context, argument: str) -> discord.Message | str:
         try:
-            msg = await commands.MessageConverter().convert(ctx, argument)
+            msg = await _MESSAGE_CONVERTER.convert(ctx, argument)
         except commands.BadArgument:
-            return await commands.clean_content().convert(ctx, argument)
+            return await _CLEAN_CONTENT.convert(ctx, argument)
         return msg
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 
 import dice_parser
@@ -10,6 +11,9 @@ ADV_WORD_RE = re.compile(r'(?:^|\s+)(adv|dis)(?:\s+|$)')
 
 def string_search_adv(dice_str: str) -> tuple[str, dice_parser.AdvType]:
     adv = dice_parser.AdvType.NONE
+    # most rolls carry no marker, a substring check is far cheaper than a regex search
+    if 'adv' not in dice_str and 'dis' not in dice_str:
+        return dice_str, adv
     if (match := ADV_WORD_RE.search(dice_str)) is not None:
         adv = dice_parser.AdvType.ADV if match.group(1) == 'adv' else dice_parser.AdvType.DIS
         return dice_str[: match.start(1)] + dice_str[match.end() :], adv
@@ -62,18 +66,20 @@ class RerollableStringifier(dice_parser.SimpleStringifier):
         return str(node.total)
 
 
+_D20_WITH_ADV: dict[dice_parser.AdvType | int, str] = {
+    dice_parser.AdvType.NONE: '1d20',
+    dice_parser.AdvType.ADV: '2d20kh1',
+    dice_parser.AdvType.DIS: '2d20kl1',
+    2: '3d20kh1',
+}
+
+
 def d20_with_adv(adv: dice_parser.AdvType | int) -> str:
-    if adv is dice_parser.AdvType.NONE:
-        return '1d20'
-    elif adv is dice_parser.AdvType.ADV:
-        return '2d20kh1'
-    elif adv is dice_parser.AdvType.DIS:
-        return '2d20kl1'
-    elif adv == 2:
-        return '3d20kh1'
-    return '1d20'
+    return _D20_WITH_ADV.get(adv, '1d20')
 
 
+# this only parses, nothing is rolled, so the result is deterministic for a given expression
+@functools.lru_cache(maxsize=1024)
 def get_roll_comment(expr: str) -> tuple[str, str]:
     result = dice_parser.parse(expr, allow_comments=True)
     return str(result.roll), (result.comment or '')
@@ -148,6 +148,21 @@ class ListPageSource(PageSource[T]):
             return self.entries[base : base + self.per_page]
 
 
+class SkipToPageModal(discord.ui.Modal, title='Go to page'):
+    page_number = discord.ui.TextInput(label='Page', min_length=1)
+
+    def __init__(self, max_pages: int | None) -> None:
+        super().__init__()
+        if max_pages is not None:
+            as_string = str(max_pages)
+            self.page_number.placeholder = f'Enter a number between 1 and {as_string}'
+            self.page_number.max_length = len(as_string)
+
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        self.interaction = interaction
+        self.stop()
+
+
 class RoboPages(discord.ui.View, Generic[SourceT]):
     def __init__(self, source: SourceT, *, ctx: Context, check_embeds: bool = True, compact: bool = False):
         super().__init__()
@@ -158,6 +173,7 @@ class RoboPages(discord.ui.View, Generic[SourceT]):
         self.current_page: int = 0
         self.compact: bool = compact
         self.input_lock = asyncio.Lock()
+        self._authorized_ids: frozenset[int | None] = frozenset((ctx.bot.owner_id, ctx.author.id))
         self.clear_items()
         self.fill_items()
 
@@ -243,7 +259,7 @@ class RoboPages(discord.ui.View, Generic[SourceT]):
             pass
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user and interaction.user.id in (self.ctx.bot.owner_id, self.ctx.author.id):
+        if interaction.user and interaction.user.id in self._authorized_ids:
             return True
         await interaction.response.send_message('This pagination menu cannot be controlled by you, sorry!', ephemeral=True)
         return False
@@ -311,26 +327,12 @@ class RoboPages(discord.ui.View, Generic[SourceT]):
         # The call here is safe because it's guarded by skip_if
         await self.show_page(interaction, self.source.get_max_pages() - 1)  # type: ignore
 
-    class SkipToPageModal(discord.ui.Modal, title='Go to page'):
-        page_number = discord.ui.TextInput(label='Page', min_length=1)
-
-        def __init__(self, max_pages: int | None) -> None:
-            super().__init__()
-            if max_pages is not None:
-                as_string = str(max_pages)
-                self.page_number.placeholder = f'Enter a number between 1 and {as_string}'
-                self.page_number.max_length = len(as_string)
-
-        async def on_submit(self, interaction: discord.Interaction) -> None:
-            self.interaction = interaction
-            self.stop()
-
     @discord.ui.button(label='Skip to page...', style=discord.ButtonStyle.grey)
     async def numbered_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
         """Lets you type a page number to go to."""
         if self.message is None:
             return
-        modal = self.SkipToPageModal(self.source.get_max_pages())
+        modal = SkipToPageModal(self.source.get_max_pages())
         await interaction.response.send_modal(modal)
         timed_out = await modal.wait()
 
@@ -342,12 +344,13 @@ class RoboPages(discord.ui.View, Generic[SourceT]):
             return
 
         value = str(modal.page_number.value)
-        if not value.isdigit():
+        try:
+            page_number = int(value)
+        except ValueError:
             await modal.interaction.response.send_message(f'Expected a number not {value!r}', ephemeral=True)
             return
 
-        value = int(value)
-        await self.show_checked_page(modal.interaction, value - 1)
+        await self.show_checked_page(modal.interaction, page_number - 1)
         if not modal.interaction.response.is_done():
             error = modal.page_number.placeholder.replace('Enter', 'Expected')  # type: ignore # Can't be None
             await modal.interaction.response.send_message(error, ephemeral=True)
@@ -384,13 +387,32 @@ class FieldPageSource(ListPageSource):
         return self.embed
 
 
+def _build_text_pages(text: str, prefix: str, suffix: str, max_size: int) -> list[str]:
+    pages = CommandPaginator(prefix=prefix, suffix=suffix, max_size=max_size - 200)
+    for line in text.split('\n'):
+        pages.add_line(line)
+    return pages.pages
+
+
 class TextPageSource(ListPageSource):
-    def __init__(self, text: str, *, prefix: str = '```', suffix: str = '```', max_size: int = 2000) -> None:
-        pages = CommandPaginator(prefix=prefix, suffix=suffix, max_size=max_size - 200)
-        for line in text.split('\n'):
-            pages.add_line(line)
+    def __init__(
+        self,
+        text: str,
+        *,
+        prefix: str = '```',
+        suffix: str = '```',
+        max_size: int = 2000,
+        pages: list[str] | None = None,
+    ) -> None:
+        if pages is None:
+            pages = _build_text_pages(text, prefix, suffix, max_size)
+        super().__init__(entries=pages, per_page=1)
 
-        super().__init__(entries=pages.pages, per_page=1)
+    @classmethod
+    async def create(cls, text: str, *, prefix: str = '```', suffix: str = '```', max_size: int = 2000) -> Self:
+        """Builds the pages in a thread, for text of unbounded size like process output."""
+        pages = await asyncio.to_thread(_build_text_pages, text, prefix, suffix, max_size)
+        return cls(text, prefix=prefix, suffix=suffix, max_size=max_size, pages=pages)
 
     async def format_page(self, menu: RoboPages, content: str) -> str:
         maximum = self.get_max_pages()
@@ -401,16 +423,13 @@ class TextPageSource(ListPageSource):
 
 class SimplePageSource(ListPageSource):
     async def format_page(self, menu: SimplePages, entries: list[str]) -> discord.Embed:
-        pages = []
-        for index, entry in enumerate(entries, start=menu.current_page * self.per_page):
-            pages.append(f'{index + 1}. {entry}')
-
+        start = menu.current_page * self.per_page + 1
         maximum = self.get_max_pages()
         if maximum > 1:
             footer = f'Page {menu.current_page + 1}/{maximum} ({len(self.entries)} entries)'
             menu.embed.set_footer(text=footer)
 
-        menu.embed.description = '\n'.join(pages)
+        menu.embed.description = '\n'.join(f'{index}. {entry}' for index, entry in enumerate(entries, start=start))
         return menu.embed
 
 
@@ -445,8 +464,6 @@ class MangadexEmbed(discord.Embed):
             parent_title += f' - {chapter.title}'
         if chapter.chapter:
             parent_title += f' [Chapter {chapter.chapter}]'
-        if parent.cover_url() is None:
-            await parent.get_cover()
 
         self = cls(title=parent_title, colour=discord.Colour.red(), url=chapter.url)
         self.set_footer(text=chapter.id)
@@ -454,16 +471,18 @@ class MangadexEmbed(discord.Embed):
         self.add_field(name='Manga link is:', value=f'[here!]({parent.url})', inline=False)
         self.add_field(name='Number of pages:', value=chapter.pages, inline=False)
         if parent.content_rating is mangadex.ContentRating.safe or (nsfw_allowed is True):
-            if chapter.manga.cover_url() is None:
-                await chapter.manga.get_cover()
-            self.set_thumbnail(url=chapter.manga.cover_url())
+            cover = parent.cover_url()
+            if cover is None:
+                await parent.get_cover()
+                cover = parent.cover_url()
+            self.set_thumbnail(url=cover)
         return self
 
     @classmethod
     async def from_manga(cls: Type[Self], manga: mangadex.Manga, *, nsfw_allowed: bool = False) -> Self:
         self = cls(title=manga.title, colour=discord.Colour.blue(), url=manga.url)
-        if manga.description:
-            self.description = shorten(manga.description, width=2000)
+        if description := manga.description:
+            self.description = description if len(description) <= 2000 else shorten(description, width=2000)
         if manga.tags:
             self.add_field(name='Tags:', value=', '.join([tag.name for tag in manga.tags]), inline=False)
         if manga.publication_demographic:
@@ -481,7 +500,9 @@ class MangadexEmbed(discord.Embed):
                 self.add_field(name='Last Chapter:', value=manga.last_chapter)
         self.set_footer(text=manga.id)
         if manga.content_rating is mangadex.ContentRating.safe or (nsfw_allowed is True):
-            if manga.cover_url() is None:
+            cover = manga.cover_url()
+            if cover is None:
                 await manga.get_cover()
-            self.set_thumbnail(url=manga.cover_url())
+                cover = manga.cover_url()
+            self.set_thumbnail(url=cover)
         return self
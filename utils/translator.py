@@ -216,8 +216,7 @@ FLAG_TO_LANG: dict[str, str] = {
 LANG_TO_FLAG: dict[str, str] = {}
 
 for flag, lang in FLAG_TO_LANG.items():
-    if lang not in LANG_TO_FLAG:
-        LANG_TO_FLAG[lang] = flag
+    LANG_TO_FLAG.setdefault(lang, flag)
 LANG_TO_FLAG['en'] = '🇬🇧'
 
 